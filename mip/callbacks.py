@@ -1,7 +1,7 @@
 """Classes used in solver callbacks, for a bi-directional communication
 with the solver engine"""
-from collections import defaultdict
-from typing import List, Tuple, TYPE_CHECKING
+from array import array
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from mip.model import Model
@@ -89,31 +89,70 @@ class ConstrsGenerator:
         raise NotImplementedError()
 
 
+def _cut_key(cut: "LinExpr") -> tuple:
+    """contents of a cut with coefficients indexed by variable index, so
+    that repeated cuts are identified by a comparison done in C, without
+    calls to Var.__hash__ or Var.__eq__"""
+    expr = cut.expr
+    return (
+        cut.sense,
+        cut.const,
+        dict(zip([var.idx for var in expr], expr.values())),
+    )
+
+
 class CutPool:
     def __init__(self):
         """Stores a list list of different cuts, repeated cuts are discarded.
         """
         self.__cuts = []
 
-        # positions for each hash code to speedup
-        # the search of repeated cuts
-        self.__pos = defaultdict(list)
+        # comparison keys of cuts, only computed when some other cut with
+        # the same hash code is added
+        self.__keys = []  # type: List[Optional[tuple]]
+
+        # position of the last cut added with each hash code and, for each
+        # cut, the position of the previous one with the same hash code (-1
+        # ends the chain), to speedup the search of repeated cuts without
+        # storing one list per hash code
+        self.__head = {}  # type: Dict[int, int]
+        self.__next = array("q")
 
     def add(self, cut: "LinExpr") -> bool:
         """tries to add a cut to the pool, returns true if this is a new cut,
-        false if it is a repeated one
+        false if it is a repeated one. The pool keeps a reference to the
+        cut, which should not be modified after it is added: cuts are
+        stored under the hash code they have when added, so later changes
+        are not seen when searching for repeated cuts
 
         Args:
             cut(LinExpr): a constraint
         """
         hcode = hash(cut)
-        bucket = self.__pos[hcode]
-        for p in bucket:
-            if self.__cuts[p].equals(cut):
+        cuts = self.__cuts
+        keys = self.__keys
+        key = None
+        first = self.__head.get(hcode, -1)
+        chain = self.__next
+        p = first
+        while p != -1:
+            # a cut offered again is found without building its key
+            if cuts[p] is cut:
                 return False
-
-        self.__pos[hcode].append(len(self.__cuts))
-        self.__cuts.append(cut)
+            if keys[p] is None:
+                keys[p] = _cut_key(cuts[p])
+            if key is None:
+                key = _cut_key(cut)
+            if keys[p] == key:
+                return False
+            p = chain[p]
+
+        # the key is kept if it was built, the hash code of the cut is
+        # cached in the cut itself
+        keys.append(key)
+        chain.append(first)
+        self.__head[hcode] = len(cuts)
+        cuts.append(cut)
 
         return True
 
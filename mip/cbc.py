@@ -8,7 +8,7 @@ import os
 import multiprocessing as multip
 import numbers
 from cffi import FFI
-from mip.model import xsum
+from mip.model import xsum, read_custom_settings
 import mip
 from mip.lists import EmptyVarSol, EmptyRowSol
 from mip.exceptions import (
@@ -56,11 +56,12 @@ DEF_PUMPP = 30
 try:
     pathmip = dirname(mip.__file__)
     pathlib = os.path.join(pathmip, "libraries")
-    libfile = ""
     # if user wants to force the loading of an specific CBC library
-    # (for debugging purposes, for example)
-    if "PMIP_CBC_LIBRARY" in os.environ:
-        libfile = os.environ["PMIP_CBC_LIBRARY"]
+    # (for debugging purposes, for example), informed in the
+    # PMIP_CBC_LIBRARY environment variable or in ~/.config/python-mip;
+    # settings are only read here, when CBC is first used
+    libfile = read_custom_settings()
+    if libfile:
         pathlib = dirname(libfile)
 
         if platform.lower().startswith("win"):
@@ -662,6 +663,11 @@ class SolverCbc(Solver):
     def get_objective_const(self) -> numbers.Real:
         return self._objconst
 
+    def set_objective_const(self, const: numbers.Real):
+        # CBC does not store the objective function constant, it is added
+        # to the objective values reported to the model
+        self._objconst = const
+
     def get_objective(self) -> LinExpr:
         obj = cbclib.Cbc_getObjCoefficients(self._model)
         if obj == ffi.NULL:
@@ -1130,11 +1136,29 @@ class SolverCbc(Solver):
         # (returns None if no solution available)
         return self.__x[var.idx]
 
+    def vars_get_x(self) -> List[Optional[numbers.Real]]:
+        if isinstance(self.__x, EmptyVarSol):
+            return [None] * self.num_cols()
+        return ffi.unpack(self.__x, self.num_cols())
+
     def get_num_solutions(self) -> int:
         return self.__num_solutions
 
     def get_objective_value_i(self, i: int) -> numbers.Real:
-        return cbclib.Cbc_savedSolutionObj(self._model, i) + self._objconst
+        # saved solution costs are stored for the minimization problem
+        mdl = self._model
+        objs = cbclib.Cbc_getObjSense(mdl)
+        return objs * cbclib.Cbc_savedSolutionObj(mdl, i) + self._objconst
+
+    def get_objective_values_all(self) -> List[numbers.Real]:
+        saved_obj = cbclib.Cbc_savedSolutionObj
+        mdl = self._model
+        objs = cbclib.Cbc_getObjSense(mdl)
+        objconst = self._objconst
+        return [
+            objs * saved_obj(mdl, i) + objconst
+            for i in range(self.__num_solutions)
+        ]
 
     def var_get_xi(self, var: "Var", i: int) -> numbers.Real:
         # model status is *already checked* Var xi property
@@ -1163,6 +1187,19 @@ class SolverCbc(Solver):
         cbclib.Cbc_getColName(self._model, idx, namep, MAX_NAME_SIZE)
         return ffi.string(namep).decode("utf-8")
 
+    def vars_get_names(self) -> List[str]:
+        # names are copied one by one to the same buffer, with the library
+        # function and the model handle looked up only once
+        namep = self.__name_space
+        get_name = cbclib.Cbc_getColName
+        model = self._model
+        string = ffi.string
+        result = []
+        for idx in range(self.num_cols()):
+            get_name(model, idx, namep, MAX_NAME_SIZE)
+            result.append(string(namep).decode("utf-8"))
+        return result
+
     def var_get_index(self, name: str) -> int:
         return cbclib.Cbc_getColNameIndex(self._model, name.encode("utf-8"))
 
@@ -1214,13 +1251,11 @@ class SolverCbc(Solver):
             self.iidx = ffi.new("int[%d]" % self.iidx_space)
             self.dvec = ffi.new("double[%d]" % self.iidx_space)
 
-        # cind = self.iidx
-        self.iidx = [var.idx for var in lin_expr.expr.keys()]
-
-        # cind = ffi.new("int[]", [var.idx for var in lin_expr.expr.keys()])
-        # cval = ffi.new("double[]", [coef for coef in lin_expr.expr.values()])
-        # cval = self.dvec
-        self.dvec = [coef for coef in lin_expr.expr.values()]
+        # rows are streamed through the preallocated buffers, which are only
+        # reallocated when a row with more nonzeros than fit is added
+        expr = lin_expr.expr
+        self.iidx[0:numnz] = [var.idx for var in expr]
+        self.dvec[0:numnz] = list(expr.values())
 
         # constraint sense and rhs
         sense = lin_expr.sense.encode("utf-8")
@@ -1351,8 +1386,10 @@ class SolverCbc(Solver):
             raise ValueError("Unknow sense: {}".format(rsense))
 
         expr = LinExpr(const=-rhs, sense=sense)
+        add_var = expr.add_var
+        model_vars = self.model.vars
         for i in range(numnz):
-            expr.add_var(self.model.vars[ridx[i]], rcoef[i])
+            add_var(model_vars[ridx[i]], rcoef[i])
 
         return expr
 
@@ -1458,6 +1495,13 @@ class ModelOsi(Model):
         self.add_lazy_constr(lin_expr)
         return None
 
+    def add_constrs(
+        self, lin_exprs: List[LinExpr], names: Optional[List[str]] = None
+    ) -> "List[Constr]":
+        for lin_expr in lin_exprs:
+            self.add_constr(lin_expr)
+        return None
+
 
 class SolverOsi(Solver):
     """Interface for the OsiSolverInterface, the generic solver interface of
@@ -1830,8 +1874,10 @@ class SolverOsi(Solver):
             raise ValueError("Unknow sense: {}".format(rsense))
 
         expr = LinExpr(const=-rhs, sense=sense)
+        add_var = expr.add_var
+        model_vars = self.model.vars
         for i in range(numnz):
-            expr.add_var(self.model.vars[ridx[i]], rcoef[i])
+            add_var(model_vars[ridx[i]], rcoef[i])
 
         return expr
 
@@ -1967,6 +2013,11 @@ class SolverOsi(Solver):
     def var_get_x(self, var: "Var") -> numbers.Real:
         return self.__x[var.idx]
 
+    def vars_get_x(self) -> List[Optional[numbers.Real]]:
+        if isinstance(self.__x, EmptyVarSol):
+            return [None] * self.num_cols()
+        return ffi.unpack(self.__x, self.num_cols())
+
     def var_get_xi(self, var: "Var", i: int) -> numbers.Real:
         raise NotImplementedError("Solution pool not supported in OsiSolver")
 
@@ -1975,6 +2026,19 @@ class SolverOsi(Solver):
         cbclib.Osi_getColName(self.osi, idx, namep, MAX_NAME_SIZE)
         return ffi.string(namep).decode("utf-8")
 
+    def vars_get_names(self) -> List[str]:
+        # names are copied one by one to the same buffer, with the library
+        # function and the model handle looked up only once
+        namep = self.__name_space
+        get_name = cbclib.Osi_getColName
+        model = self.osi
+        string = ffi.string
+        result = []
+        for idx in range(self.num_cols()):
+            get_name(model, idx, namep, MAX_NAME_SIZE)
+            result.append(string(namep).decode("utf-8"))
+        return result
+
     def remove_vars(self, varsList: List[int]):
         raise NotImplementedError("Not supported in OsiSolver")
 
@@ -1,5 +1,7 @@
 from builtins import property
-from typing import List, Optional, Dict, Union, TYPE_CHECKING
+from operator import attrgetter
+from typing import Callable, List, Optional, Dict, Sequence, Union
+from typing import TYPE_CHECKING
 import numbers
 
 from mip.constants import (
@@ -18,6 +20,16 @@ from mip.constants import (
 if TYPE_CHECKING:
     from mip.model import Model
 
+_get_idx = attrgetter("idx")
+
+# optimization status values for which a solution is available
+_SOLUTION_AVAILABLE = frozenset(
+    (OptimizationStatus.OPTIMAL, OptimizationStatus.FEASIBLE)
+)
+
+# valid values for Var.var_type
+_VAR_TYPES = frozenset((BINARY, CONTINUOUS, INTEGER))
+
 
 class Column:
     """A column contains all the non-zero entries of a variable in the
@@ -80,7 +92,7 @@ class LinExpr:
 
     """
 
-    __slots__ = ["__const", "__expr", "__sense"]
+    __slots__ = ["__const", "__expr", "__sense", "__hash"]
 
     def __init__(
         self,
@@ -92,20 +104,63 @@ class LinExpr:
         self.__const = const
         self.__expr = {}  # type: Dict[Var, numbers.Real]
         self.__sense = sense
+        self.__hash = None  # type: Optional[int]
 
         if variables:
             if len(variables) != len(coeffs):
                 raise ValueError(
                     "Coefficients and variables must be same length."
                 )
-            for i in range(len(coeffs)):
-                if abs(coeffs[i]) <= 1e-12:
+            if len(variables) >= 32:
+                # larger sums usually have distinct variables and non-zero
+                # coefficients, so the dict is built at once and only
+                # rebuilt term by term if that turns out not to be the case
+                expr = dict(zip(variables, coeffs))
+                if len(expr) == len(variables) and (
+                    min(map(abs, coeffs)) > 1e-12
+                ):
+                    self.__expr = expr
+                    return
+            # terms are merged in a single pass, without one add_var call
+            # per term
+            expr = self.__expr
+            for var, coeff in zip(variables, coeffs):
+                if -1e-12 <= coeff <= 1e-12:
                     continue
-                self.add_var(variables[i], coeffs[i])
+                if var in expr:
+                    coeff += expr[var]
+                    if -EPS <= coeff <= EPS:
+                        del expr[var]
+                        continue
+                expr[var] = coeff
+
+    @staticmethod
+    def _term(
+        var: "Var",
+        coeff: numbers.Real,
+        const: numbers.Real = 0.0,
+        sense: str = "",
+    ) -> "LinExpr":
+        """creates the expression coeff * var + const, without the argument
+        lists and the merging loop of the constructor; used by the Var
+        operators, which create one such expression per operation"""
+        result = LinExpr.__new__(LinExpr)
+        result.__const = const
+        result.__expr = {} if -1e-12 <= coeff <= 1e-12 else {var: coeff}
+        result.__sense = sense
+        result.__hash = None
+        return result
 
     def __add__(
         self: "LinExpr", other: Union["Var", "LinExpr", numbers.Real]
     ) -> "LinExpr":
+        if isinstance(other, LinExpr) and len(other.__expr) > len(self.__expr):
+            # merging costs one dict probe per merged term, so the larger
+            # expression is copied and the smaller one merged into it
+            result = other.copy()
+            result.__sense = self.__sense
+            result.add_expr(self)
+            return result
         result = self.copy()
         if isinstance(other, Var):
             result.add_var(other, 1)
@@ -138,6 +193,12 @@ class LinExpr:
     def __sub__(
         self: "LinExpr", other: Union["Var", "LinExpr", numbers.Real]
     ) -> "LinExpr":
+        if isinstance(other, LinExpr) and len(other.__expr) > len(self.__expr):
+            # negating is cheaper than merging term by term, see __add__
+            result = other.__mul__(-1)
+            result.__sense = self.__sense
+            result.add_expr(self)
+            return result
         result = self.copy()
         if isinstance(other, Var):
             result.add_var(other, -1)
@@ -152,7 +213,7 @@ class LinExpr:
     def __rsub__(
         self: "LinExpr", other: Union["Var", "LinExpr", numbers.Real]
     ) -> "LinExpr":
-        return (-self).__add__(other)
+        return self.__mul__(-1).__iadd__(other)
 
     def __isub__(
         self: "LinExpr", other: Union["Var", "LinExpr", numbers.Real]
@@ -172,10 +233,10 @@ class LinExpr:
             raise TypeError(
                 "Can not multiply with type {}".format(type(other))
             )
-        result = self.copy()
-        result.__const *= other
-        for var in result.__expr.keys():
-            result.__expr[var] *= other
+        result = LinExpr(const=self.__const * other, sense=self.__sense)
+        result.__expr = {
+            var: coeff * other for var, coeff in self.__expr.items()
+        }
         return result
 
     def __rmul__(self: "LinExpr", other: numbers.Real) -> "LinExpr":
@@ -186,26 +247,30 @@ class LinExpr:
             raise TypeError(
                 "Can not multiply with type {}".format(type(other))
             )
+        self.__hash = None
         self.__const *= other
-        for var in self.__expr.keys():
-            self.__expr[var] *= other
+        expr = self.__expr
+        for var in expr:
+            expr[var] *= other
         return self
 
     def __truediv__(self: "LinExpr", other: numbers.Real) -> "LinExpr":
         if not isinstance(other, numbers.Real):
             raise TypeError("Can not divide with type {}".format(type(other)))
-        result = self.copy()
-        result.__const /= other
-        for var in result.__expr.keys():
-            result.__expr[var] /= other
+        result = LinExpr(const=self.__const / other, sense=self.__sense)
+        result.__expr = {
+            var: coeff / other for var, coeff in self.__expr.items()
+        }
         return result
 
     def __itruediv__(self: "LinExpr", other: numbers.Real) -> "LinExpr":
         if not isinstance(other, numbers.Real):
             raise TypeError("Can not divide with type {}".format(type(other)))
+        self.__hash = None
         self.__const /= other
-        for var in self.__expr.keys():
-            self.__expr[var] /= other
+        expr = self.__expr
+        for var in expr:
+            expr[var] /= other
         return self
 
     def __neg__(self: "LinExpr") -> "LinExpr":
@@ -213,38 +278,36 @@ class LinExpr:
 
     def __str__(self: "LinExpr") -> str:
         result = []
+        append = result.append
+        sense = self.__sense
+
+        if sense == MINIMIZE:
+            append("Minimize ")
+        elif sense == MAXIMIZE:
+            append("Maximize ")
+
+        for var, coeff in self.__expr.items():
+            append("+ " if coeff >= 0 else "- ")
+            mag = abs(coeff)
+            if mag != 1:
+                append(str(mag))
+            append(var.name)
+            append(" ")
+
+        const = self.__const
+        if sense == EQUAL:
+            append("= ")
+        elif sense == LESS_OR_EQUAL:
+            append("<= ")
+        elif sense == GREATER_OR_EQUAL:
+            append(">= ")
+        else:
+            if const != 0:
+                append("+ " + str(const) if const > 0 else "- " + str(-const))
+            return "".join(result)
 
-        if hasattr(self, "__sense"):
-            if self.__sense == MINIMIZE:
-                result.append("Minimize ")
-            elif self.__sense == MAXIMIZE:
-                result.append("Minimize ")
-
-        if self.__expr:
-            for var, coeff in self.__expr.items():
-                result.append("+ " if coeff >= 0 else "- ")
-                result.append(str(abs(coeff)) if abs(coeff) != 1 else "")
-                result.append("{var} ".format(**locals()))
-
-        if hasattr(self, "__sense"):
-            if self.__sense == EQUAL:
-                result.append(" = ")
-            if self.__sense == LESS_OR_EQUAL:
-                result.append(" <= ")
-            if self.__sense == GREATER_OR_EQUAL:
-                result.append(" >= ")
-            result.append(
-                str(abs(self.__const))
-                if self.__const < 0
-                else "- " + str(abs(self.__const))
-            )
-        elif self.__const != 0:
-            result.append(
-                "+ " + str(abs(self.__const))
-                if self.__const > 0
-                else "- " + str(abs(self.__const))
-            )
-
+        # right-hand-side of the constraint
+        append(str(-const) if const != 0 else "0")
         return "".join(result)
 
     def __eq__(self: "LinExpr", other) -> "LinExpr":
@@ -269,13 +332,44 @@ class LinExpr:
     def add_const(self: "LinExpr", __const: numbers.Real):
         """adds a constant value to the linear expression, in the case of
         a constraint this correspond to the right-hand-side"""
+        self.__hash = None
         self.__const += __const
 
     def add_expr(self: "LinExpr", __expr: "LinExpr", coeff: numbers.Real = 1):
         """extends a linear expression with the contents of another"""
+        self.__hash = None
         self.__const += __expr.__const * coeff
-        for var, coeff_var in __expr.__expr.items():
-            self.add_var(var, coeff_var * coeff)
+        if not self.__expr:
+            # nothing to merge with, terms can be copied in bulk
+            if coeff == 1:
+                self.__expr = __expr.__expr.copy()
+            else:
+                self.__expr = {
+                    var: coeff_var * coeff
+                    for var, coeff_var in __expr.__expr.items()
+                }
+            return
+        expr = self.__expr
+        other = __expr.__expr
+        # for larger expressions without common variables no coefficient
+        # can cancel out, so the merge is left to dict.update
+        if len(other) >= 32 and expr.keys().isdisjoint(other):
+            if coeff == 1:
+                expr.update(other)
+            else:
+                expr.update(
+                    (var, coeff_var * coeff)
+                    for var, coeff_var in other.items()
+                )
+            return
+        for var, coeff_var in other.items():
+            coeff_var *= coeff
+            if var in expr:
+                coeff_var += expr[var]
+                if -EPS <= coeff_var <= EPS:
+                    del expr[var]
+                    continue
+            expr[var] = coeff_var
 
     def add_term(
         self: "LinExpr",
@@ -295,46 +389,99 @@ class LinExpr:
 
     def add_var(self: "LinExpr", var: "Var", coeff: numbers.Real = 1):
         """adds a variable with a coefficient to the constraint"""
-        if var in self.__expr:
-            if -EPS <= self.__expr[var] + coeff <= EPS:
-                del self.__expr[var]
-            else:
-                self.__expr[var] += coeff
+        self.__hash = None
+        expr = self.__expr
+        current = expr.get(var)
+        if current is None:
+            expr[var] = coeff
+            return
+        coeff += current
+        if -EPS <= coeff <= EPS:
+            del expr[var]
         else:
-            self.__expr[var] = coeff
+            expr[var] = coeff
 
     def copy(self: "LinExpr") -> "LinExpr":
-        copy = LinExpr()
+        # all slots are assigned here, so __init__ is skipped
+        copy = LinExpr.__new__(LinExpr)
         copy.__const = self.__const
         copy.__expr = self.__expr.copy()
         copy.__sense = self.__sense
+        copy.__hash = self.__hash
         return copy
 
     def equals(self: "LinExpr", other: "LinExpr") -> bool:
         """returns true if a linear expression equals to another,
         false otherwise"""
+        if self is other:
+            return True
         if self.__sense != other.__sense:
             return False
         if len(self.__expr) != len(other.__expr):
             return False
         if abs(self.__const - other.__const) >= 1e-12:
             return False
-        other_contents = {vr.idx: coef for vr, coef in other.__expr.items()}
+        other_expr = other.__expr
+        other_contents = dict(
+            zip(map(_get_idx, other_expr), other_expr.values())
+        )
+        get_coeff = other_contents.get
         for (v, c) in self.__expr.items():
-            if v.idx not in other_contents:
-                return False
-            oc = other_contents[v.idx]
-            if abs(c - oc) > 1e-12:
+            oc = get_coeff(v.idx)
+            if oc is None or abs(c - oc) > 1e-12:
                 return False
         return True
 
+    def compile_eval(
+        self: "LinExpr",
+    ) -> Callable[[Sequence[numbers.Real]], numbers.Real]:
+        """returns a function that evaluates this linear expression for a
+        sequence of values indexed by variable index (e.g. the fractional
+        solution received in a cut generator). Coefficients and indexes are
+        bound when the function is created, so it should be created again if
+        the expression changes. Useful when the same expression is evaluated
+        many times:
+
+        .. code:: python
+
+          f = cut.compile_eval()
+          xf = [v.x for v in model.vars]
+          if f(xf) > 1e-6:
+              ...
+        """
+        terms = [
+            "vals[{}] * {!r}".format(var.idx, float(coeff))
+            for var, coeff in self.__expr.items()
+        ]
+        # terms are summed in groups, so that the generated expression is
+        # not nested too deeply to be compiled for very large expressions
+        groups = [
+            " + ".join(terms[i : i + 64]) for i in range(0, len(terms), 64)
+        ]
+        const = float(self.__const)
+        if groups:
+            body = "sum(({},), {!r})".format(", ".join(groups), const)
+        else:
+            body = repr(const)
+        namespace = {"inf": float("inf"), "nan": float("nan")}
+        exec("def evaluate(vals):\n    return " + body, namespace)
+        return namespace["evaluate"]
+
     def __hash__(self: "LinExpr"):
-        hash_el = [v.idx for v in self.__expr.keys()]
-        for c in self.__expr.values():
-            hash_el.append(c)
-        hash_el.append(self.__const)
-        hash_el.append(self.__sense)
-        return hash(tuple(hash_el))
+        # the hash code is cached until the expression is modified by one of
+        # its methods; (variable index, coefficient) pairs are hashed as a
+        # set, so that it does not depend on the order in which terms were
+        # inserted
+        if self.__hash is None:
+            expr = self.__expr
+            self.__hash = hash(
+                (
+                    frozenset(zip(map(_get_idx, expr), expr.values())),
+                    self.__const,
+                    self.__sense,
+                )
+            )
+        return self.__hash
 
     @property
     def const(self: "LinExpr") -> numbers.Real:
@@ -368,6 +515,7 @@ class LinExpr:
         empty ("") if this is an affine expression, such as the objective
         function
         """
+        self.__hash = None
         self.__sense = value
 
     @property
@@ -449,7 +597,7 @@ class Constr:
                 line += "\n\t"
                 len_line = 0
         res += line
-        rhs = self.expr.const * -1.0
+        rhs = -self.expr.const
         if self.expr.sense == "=":
             res += " = {}".format(rhs)
         elif self.expr.sense == "<":
@@ -515,12 +663,18 @@ class Var:
         return self.idx
 
     def __add__(self, other: Union["Var", LinExpr, numbers.Real]) -> LinExpr:
+        # int and float operands are by far the most frequent ones and are
+        # tested first by type: the isinstance check against the
+        # numbers.Real ABC is several times slower
+        t = type(other)
+        if t is float or t is int:
+            return LinExpr._term(self, 1, other)
         if isinstance(other, Var):
             return LinExpr([self, other], [1, 1])
         if isinstance(other, LinExpr):
             return other.__add__(self)
         if isinstance(other, numbers.Real):
-            return LinExpr([self], [1], other)
+            return LinExpr._term(self, 1, other)
 
         raise TypeError("type {} not supported".format(type(other)))
 
@@ -528,78 +682,85 @@ class Var:
         return self.__add__(other)
 
     def __sub__(self, other: Union["Var", LinExpr, numbers.Real]) -> LinExpr:
+        t = type(other)
+        if t is float or t is int:
+            return LinExpr._term(self, 1, -other)
         if isinstance(other, Var):
             return LinExpr([self, other], [1, -1])
-        elif isinstance(other, LinExpr):
+        if isinstance(other, LinExpr):
             return (-other).__iadd__(self)
-        elif isinstance(other, numbers.Real):
-            return LinExpr([self], [1], -other)
-        else:
-            raise TypeError("type {} not supported".format(type(other)))
+        if isinstance(other, numbers.Real):
+            return LinExpr._term(self, 1, -other)
+
+        raise TypeError("type {} not supported".format(type(other)))
 
     def __rsub__(self, other: Union["Var", LinExpr, numbers.Real]) -> LinExpr:
+        t = type(other)
+        if t is float or t is int:
+            return LinExpr._term(self, -1, other)
         if isinstance(other, Var):
             return LinExpr([self, other], [-1, 1])
-        elif isinstance(other, LinExpr):
+        if isinstance(other, LinExpr):
             return other.__sub__(self)
-        elif isinstance(other, numbers.Real):
-            return LinExpr([self], [-1], other)
-        else:
-            raise TypeError("type {} not supported".format(type(other)))
+        if isinstance(other, numbers.Real):
+            return LinExpr._term(self, -1, other)
+
+        raise TypeError("type {} not supported".format(type(other)))
 
     def __mul__(self, other: numbers.Real) -> LinExpr:
-        if not isinstance(other, numbers.Real):
+        t = type(other)
+        if not (t is float or t is int or isinstance(other, numbers.Real)):
             raise TypeError(
                 "Can not multiply with type {}".format(type(other))
             )
-        return LinExpr([self], [other])
+        return LinExpr._term(self, other)
 
     def __rmul__(self, other: numbers.Real) -> LinExpr:
         return self.__mul__(other)
 
     def __truediv__(self, other: numbers.Real) -> LinExpr:
-        if not isinstance(other, numbers.Real):
+        t = type(other)
+        if not (t is float or t is int or isinstance(other, numbers.Real)):
             raise TypeError("Can not divide with type {}".format(type(other)))
-        return self.__mul__(1.0 / other)
+        return LinExpr._term(self, 1.0 / other)
 
     def __neg__(self) -> LinExpr:
-        return LinExpr([self], [-1.0])
+        return LinExpr._term(self, -1.0)
+
+    def __cmp(
+        self, other: Union["Var", LinExpr, numbers.Real], sense: str
+    ) -> LinExpr:
+        """builds the constraint self (sense) other, shared by __eq__,
+        __le__ and __ge__"""
+        t = type(other)
+        if t is float or t is int or isinstance(other, numbers.Real):
+            return LinExpr._term(self, 1, -other, sense)
+        if isinstance(other, Var):
+            if other.idx == self.idx:
+                # x == x is the empty constraint; this is also the case
+                # reached by dicts (such as LinExpr.expr) when two distinct
+                # Var objects of the same column collide, where building
+                # the expression would compare them again
+                return LinExpr(sense=sense)
+            return LinExpr([self, other], [1, -1], sense=sense)
+        if isinstance(other, LinExpr):
+            # written as other (mirrored sense) self, as LinExpr does
+            if sense == "=":
+                return other == self
+            if sense == "<":
+                return other >= self
+            return other <= self
+
+        raise TypeError("type {} not supported".format(type(other)))
 
     def __eq__(self, other) -> LinExpr:
-        if isinstance(other, Var):
-            return LinExpr([self, other], [1, -1], sense="=")
-        elif isinstance(other, LinExpr):
-            return other == self
-        elif isinstance(other, numbers.Real):
-            if other != 0:
-                return LinExpr([self], [1], -1 * other, sense="=")
-            return LinExpr([self], [1], sense="=")
-        else:
-            raise TypeError("type {} not supported".format(type(other)))
+        return self.__cmp(other, "=")
 
     def __le__(self, other: Union["Var", LinExpr, numbers.Real]) -> LinExpr:
-        if isinstance(other, Var):
-            return LinExpr([self, other], [1, -1], sense="<")
-        elif isinstance(other, LinExpr):
-            return other >= self
-        elif isinstance(other, numbers.Real):
-            if other != 0:
-                return LinExpr([self], [1], -1 * other, sense="<")
-            return LinExpr([self], [1], sense="<")
-        else:
-            raise TypeError("type {} not supported".format(type(other)))
+        return self.__cmp(other, "<")
 
     def __ge__(self, other: Union["Var", LinExpr, numbers.Real]) -> LinExpr:
-        if isinstance(other, Var):
-            return LinExpr([self, other], [1, -1], sense=">")
-        elif isinstance(other, LinExpr):
-            return other <= self
-        elif isinstance(other, numbers.Real):
-            if other != 0:
-                return LinExpr([self], [1], -1 * other, sense=">")
-            return LinExpr([self], [1], sense=">")
-        else:
-            raise TypeError("type {} not supported".format(type(other)))
+        return self.__cmp(other, ">")
 
     @property
     def name(self) -> str:
@@ -643,7 +804,7 @@ class Var:
 
     @var_type.setter
     def var_type(self, value: str):
-        if value not in (BINARY, CONTINUOUS, INTEGER):
+        if value not in _VAR_TYPES:
             raise ValueError(
                 "Expected one of {}, but got {}".format(
                     (BINARY, CONTINUOUS, INTEGER), value
@@ -677,9 +838,6 @@ class Var:
     def xi(self, i: int) -> Optional[numbers.Real]:
         """Value for this variable in the :math:`i`-th solution from the solution
         pool. Note that None is returned if the solution is not available."""
-        if self.__model.status in [
-            OptimizationStatus.OPTIMAL,
-            OptimizationStatus.FEASIBLE,
-        ]:
+        if self.__model.status in _SOLUTION_AVAILABLE:
             return self.__model.solver.var_get_xi(self, i)
         return None
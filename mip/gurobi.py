@@ -1,7 +1,8 @@
+from array import array
 from ctypes.util import find_library
 import logging
 from sys import maxsize, platform
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from os.path import isfile
 import os.path
 from glob import glob
@@ -175,6 +176,9 @@ ffi.cdef(
     int GRBgetstrattr (GRBmodel *model, const char *attrname,
         char **valueP);
 
+    int GRBgetstrattrarray(GRBmodel *model, const char *attrname,
+        int first, int len, char **values);
+
     int GRBsetstrattr (GRBmodel *model, const char *attrname,
         const char *newvalue);
 
@@ -195,9 +199,18 @@ ffi.cdef(
                 double obj, double lb, double ub, char vtype,
                 const char *varname);
 
+    int GRBaddvars(GRBmodel *model, int numvars, int numnz,
+                int *vbeg, int *vind, double *vval,
+                double *obj, double *lb, double *ub, char *vtype,
+                const char **varnames);
+
     int GRBaddconstr(GRBmodel *model, int numnz, int *cind, double *cval,
            char sense, double rhs, const char *constrname);
 
+    int GRBaddconstrs(GRBmodel *model, int numconstrs, int numnz,
+                int *cbeg, int *cind, double *cval,
+                char *sense, double *rhs, const char **constrnames);
+
     int GRBaddsos(GRBmodel *model,
         int numsos, int nummembers, int *types,
             int *beg, int *ind, double *weight);
@@ -253,7 +266,9 @@ GRBnewmodel = grblib.GRBnewmodel
 GRBfreeenv = grblib.GRBfreeenv
 GRBfreemodel = grblib.GRBfreemodel
 GRBaddvar = grblib.GRBaddvar
+GRBaddvars = grblib.GRBaddvars
 GRBaddconstr = grblib.GRBaddconstr
+GRBaddconstrs = grblib.GRBaddconstrs
 GRBaddsos = grblib.GRBaddsos
 GRBoptimize = grblib.GRBoptimize
 GRBgetvarbyname = grblib.GRBgetvarbyname
@@ -290,6 +305,7 @@ GRBdelvars = grblib.GRBdelvars
 GRBdelconstrs = grblib.GRBdelconstrs
 GRBgetenv = grblib.GRBgetenv
 GRBgetstrattr = grblib.GRBgetstrattr
+GRBgetstrattrarray = grblib.GRBgetstrattrarray
 GRBsetstrattr = grblib.GRBsetstrattr
 GRBgetdblattrarray = grblib.GRBgetdblattrarray
 
@@ -467,6 +483,41 @@ class SolverGurobi(Solver):
         if vtype == BINARY or vtype == INTEGER:
             self.__n_int_buffer += 1
 
+    def add_vars(
+        self,
+        obj: List[float],
+        lb: List[float],
+        ub: List[float],
+        var_type: List[str],
+        names: List[str],
+    ):
+        n = len(names)
+        keep_alive_str = [
+            ffi.new("char[]", name.encode("utf-8")) for name in names
+        ]
+        st = GRBaddvars(
+            self._model,
+            n,
+            0,
+            ffi.NULL,
+            ffi.NULL,
+            ffi.NULL,
+            ffi.new("double[]", obj),
+            ffi.new("double[]", lb),
+            ffi.new("double[]", ub),
+            ffi.new("char[]", "".join(var_type).encode("utf-8")),
+            ffi.new("char *[]", keep_alive_str),
+        )
+        if st != 0:
+            raise ParameterNotAvailable(
+                "Error adding {} variables to model.".format(n)
+            )
+
+        self.__n_cols_buffer += n
+        self.__n_int_buffer += sum(
+            1 for vt in var_type if vt == BINARY or vt == INTEGER
+        )
+
     def add_cut(self, lin_expr: LinExpr):
         # added in SolverGurobiCB
 
@@ -494,6 +545,52 @@ class SolverGurobi(Solver):
             )
         self.__n_rows_buffer += 1
 
+    def add_constrs(self, lin_exprs: List[LinExpr], names: List[str]):
+        # collecting all rows in a single compressed sparse row structure,
+        # stored in typed arrays (8 bytes per double, 4 per index) instead
+        # of lists of boxed numbers and handed to the C library without
+        # copies
+        cbeg = array("i")
+        cind = array("i")
+        cval = array("d")
+        for lin_expr in lin_exprs:
+            expr = lin_expr.expr
+            cbeg.append(len(cind))
+            cind.extend(var.idx for var in expr.keys())
+            cval.extend(expr.values())
+
+        # constraint senses and rhs
+        sense = "".join(lin_expr.sense for lin_expr in lin_exprs)
+        rhs = [-lin_expr.const for lin_expr in lin_exprs]
+
+        first = self.num_rows()
+        keep_alive_str = [
+            ffi.new(
+                "char[]",
+                (name if name else "r({})".format(first + i)).encode("utf-8"),
+            )
+            for i, name in enumerate(names)
+        ]
+
+        st = GRBaddconstrs(
+            self._model,
+            len(lin_exprs),
+            len(cind),
+            ffi.from_buffer("int[]", cbeg),
+            ffi.from_buffer("int[]", cind),
+            ffi.from_buffer("double[]", cval),
+            ffi.new("char[]", sense.encode("utf-8")),
+            ffi.new("double[]", rhs),
+            ffi.new("char *[]", keep_alive_str),
+        )
+        if st != 0:
+            raise ParameterNotAvailable(
+                "Error adding {} constraints to the model".format(
+                    len(lin_exprs)
+                )
+            )
+        self.__n_rows_buffer += len(lin_exprs)
+
     def add_lazy_constr(self: "Solver", lin_expr: "LinExpr"):
         self.flush_rows()
         self.set_int_param("LazyConstraints", 1)
@@ -1037,8 +1134,10 @@ class SolverGurobi(Solver):
             sense = EQUAL
 
         expr = LinExpr(const=-rhs[0], sense=sense)
+        add_var = expr.add_var
+        model_vars = self.model.vars
         for i in range(nz):
-            expr.add_var(self.model.vars[cind[i]], cval[i])
+            add_var(model_vars[cind[i]], cval[i])
 
         return expr
 
@@ -1169,10 +1268,25 @@ class SolverGurobi(Solver):
     def var_get_x(self, var: Var) -> float:
         return self.__x[var.idx]
 
+    def vars_get_x(self) -> List[Optional[float]]:
+        if isinstance(self.__x, EmptyVarSol):
+            return [None] * self.num_cols()
+        return ffi.unpack(self.__x, len(self.__x))
+
     def var_get_name(self, idx: int) -> str:
         self.flush_cols()
         return self.get_str_attr_element("VarName", idx)
 
+    def vars_get_names(self) -> List[str]:
+        self.flush_cols()
+        n = self.num_cols()
+        names = ffi.new("char *[]", n)
+        attr = "VarName".encode("utf-8")
+        st = GRBgetstrattrarray(self._model, attr, 0, n, names)
+        if st != 0:
+            raise ParameterNotAvailable("Error getting variable names")
+        return [ffi.string(name).decode("utf-8") for name in names]
+
     def remove_vars(self, varsList: List[int]):
         idx = ffi.new("int[]", varsList)
         st = GRBdelvars(self._model, len(varsList), idx)
@@ -1587,3 +1701,10 @@ class ModelGurobiCB(Model):
 
         self.add_lazy_constr(lin_expr)
         return None
+
+    def add_constrs(
+        self, lin_exprs: List[LinExpr], names: Optional[List[str]] = None
+    ) -> "List[Constr]":
+        for lin_expr in lin_exprs:
+            self.add_constr(lin_expr)
+        return None
@@ -1,5 +1,5 @@
 from collections.abc import Sequence
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 from mip.constants import BINARY, CONTINUOUS, INF
 from mip.entities import Column, Constr, LinExpr, Var
 
@@ -49,6 +49,26 @@ class VarList(Sequence):
         self.__vars.append(new_var)
         return new_var
 
+    def add_vars(
+        self,
+        names: List[str],
+        lb: List[float],
+        ub: List[float],
+        obj: List[float],
+        var_types: List[str],
+    ) -> List[Var]:
+        first = len(self.__vars)
+        names = [
+            name if name else "var({})".format(first + i)
+            for i, name in enumerate(names)
+        ]
+        lb = [0.0 if vt == BINARY else l for (l, vt) in zip(lb, var_types)]
+        ub = [1.0 if vt == BINARY else u for (u, vt) in zip(ub, var_types)]
+        self.__model.solver.add_vars(obj, lb, ub, var_types, names)
+        new_vars = [Var(self.__model, first + i) for i in range(len(names))]
+        self.__vars.extend(new_vars)
+        return new_vars
+
     def __getitem__(self: "VarList", key):
         if isinstance(key, str):
             return self.__model.var_by_name(key)
@@ -78,13 +98,16 @@ class VarList(Sequence):
 
 
 # same as VarList but does not stores
-# references for variables, used in
-# callbacks
+# references for all variables, used in
+# callbacks; variables accessed are interned
+# so that each column maps to a single Var
+# object
 class VVarList(Sequence):
     def __init__(
         self: "VVarList", model: "Model", start: int = -1, end: int = -1
     ):
         self.__model = model
+        self.__interned = {}  # type: Dict[int, Var]
         if start == -1:
             self.__start = 0
             self.__end = model.solver.num_cols()
@@ -107,8 +130,10 @@ class VVarList(Sequence):
         if var_type == BINARY:
             lb = 0.0
             ub = 1.0
-        new_var = Var(self.__model, solver.num_cols())
+        idx = solver.num_cols()
+        new_var = Var(self.__model, idx)
         solver.add_var(obj, lb, ub, var_type, column, name)
+        self.__interned[idx] = new_var
         return new_var
 
     def __getitem__(self: "VVarList", key):
@@ -122,7 +147,12 @@ class VVarList(Sequence):
             if key >= self.__end:
                 raise IndexError
 
-            return Var(self.__model, key + self.__start)
+            idx = key + self.__start
+            var = self.__interned.get(idx)
+            if var is None:
+                var = Var(self.__model, idx)
+                self.__interned[idx] = var
+            return var
 
         raise TypeError("Unknown type {}".format(type(key)))
 
@@ -150,6 +180,21 @@ class ConstrList(Sequence):
         self.__constrs.append(new_constr)
         return new_constr
 
+    def add_constrs(
+        self, lin_exprs: List[LinExpr], names: List[str]
+    ) -> List[Constr]:
+        first = len(self.__constrs)
+        names = [
+            name if name else "constr({})".format(first + i)
+            for i, name in enumerate(names)
+        ]
+        self.__model.solver.add_constrs(lin_exprs, names)
+        new_constrs = [
+            Constr(self.__model, first + i) for i in range(len(names))
+        ]
+        self.__constrs.extend(new_constrs)
+        return new_constrs
+
     def __len__(self) -> int:
         return len(self.__constrs)
 
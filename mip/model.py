@@ -32,6 +32,43 @@ import numbers
 
 logger = logging.getLogger(__name__)
 
+# solver classes already resolved, indexed by upper case solver name, so
+# that the solver libraries are searched only once
+_solver_classes = {}  # type: Dict[str, Tuple[type, str]]
+
+
+def _solver_class(solver_name: str) -> Tuple[type, str]:
+    """Returns the solver class for solver_name and the name to be stored in
+    the model: the informed one or, if it was not informed or is unknown, the
+    automatically selected solver (gurobi if available, cbc otherwise)"""
+    key = solver_name.upper()
+    resolved = _solver_classes.get(key)
+    if resolved is None:
+        if key in ["GUROBI", "GRB"]:
+            from mip.gurobi import SolverGurobi
+
+            resolved = (SolverGurobi, GUROBI)
+        elif key == "CBC":
+            from mip.cbc import SolverCbc
+
+            resolved = (SolverCbc, CBC)
+        else:
+            # checking which solvers are available
+            try:
+                from mip.gurobi import SolverGurobi
+
+                resolved = (SolverGurobi, GUROBI)
+            except ImportError:
+                from mip.cbc import SolverCbc
+
+                resolved = (SolverCbc, CBC)
+
+        _solver_classes[key] = resolved
+
+    if key in ["GUROBI", "GRB", "CBC"]:
+        return resolved[0], solver_name
+    return resolved
+
 
 class Model:
     """ Mixed Integer Programming Model
@@ -91,39 +128,15 @@ class Model:
 
         # reading solver_name from an environment variable (if applicable)
         if not solver:
-            if not self.solver_name and "solver_name" in environ:
-                self.solver_name = environ["solver_name"]
-            if not self.solver_name and "solver_name".upper() in environ:
-                self.solver_name = environ["solver_name".upper()]
+            if not self.solver_name:
+                self.solver_name = environ.get(
+                    "solver_name", environ.get("SOLVER_NAME", "")
+                )
 
             # creating a solver instance
-            if self.solver_name.upper() in ["GUROBI", "GRB"]:
-                from mip.gurobi import SolverGurobi
-
-                self.solver = SolverGurobi(self, name, sense)
-            elif self.solver_name.upper() == "CBC":
-                from mip.cbc import SolverCbc
-
-                self.solver = SolverCbc(self, name, sense)
-            else:
-                # checking which solvers are available
-                try:
-                    from mip.gurobi import SolverGurobi
-
-                    has_gurobi = True
-                except ImportError:
-                    has_gurobi = False
-
-                if has_gurobi:
-                    from mip.gurobi import SolverGurobi
-
-                    self.solver = SolverGurobi(self, name, sense)
-                    self.solver_name = GUROBI
-                else:
-                    from mip.cbc import SolverCbc
-
-                    self.solver = SolverCbc(self, name, sense)
-                    self.solver_name = CBC
+            solver_class, solver_name = _solver_class(self.solver_name)
+            self.solver = solver_class(self, name, sense)
+            self.solver_name = solver_name
 
         # list of constraints and variables
         self.constrs = ConstrList(self)
@@ -173,8 +186,9 @@ class Model:
                 else:
                     self.add_constr(other[0], other[1])
         elif isinstance(other, CutPool):
+            add_constr = self.add_constr
             for cut in other.cuts:
-                self.add_constr(cut)
+                add_constr(cut)
         else:
             raise TypeError("type {} not supported".format(type(other)))
 
@@ -216,6 +230,71 @@ class Model:
         """
         return self.vars.add(name, lb, ub, obj, var_type, column)
 
+    def add_vars(
+        self: "Model",
+        n: int,
+        names: Optional[List[str]] = None,
+        lb: Union[float, List[float]] = 0.0,
+        ub: Union[float, List[float]] = INF,
+        obj: Union[float, List[float]] = 0.0,
+        var_type: Union[str, List[str]] = CONTINUOUS,
+    ) -> List[Var]:
+        """ Creates :code:`n` new variables in the model, returning their
+        references
+
+        All variables are sent to the solver engine at once, which is
+        faster than calling :meth:`~mip.model.Model.add_var` :code:`n`
+        times when the solver supports bulk insertion.
+
+        Args:
+            n (int): number of variables
+            names (List[str]): variable names (optional), one name per
+              variable
+            lb (float): lower bound, a single value for all variables or a
+              list with one value per variable, default 0.0
+            ub (float): upper bound, a single value for all variables or a
+              list with one value per variable, default infinity
+            obj (float): objective function coefficient, a single value
+              for all variables or a list with one value per variable,
+              default 0
+            var_type (str): CONTINUOUS ("C"), BINARY ("B") or INTEGER
+              ("I"), a single value for all variables or a list with one
+              value per variable
+
+        Examples:
+
+            The following code creates a vector of binary variables
+            :code:`x[0], ..., x[n-1]` to model :code:`m`::
+
+                x = m.add_vars(n, var_type=BINARY)
+        """
+
+        def expand(value, what: str) -> List:
+            if isinstance(value, (numbers.Real, str)):
+                return [value] * n
+            value = list(value)
+            if len(value) != n:
+                raise ValueError(
+                    "{} values informed for {} but {} variables are "
+                    "being created".format(len(value), what, n)
+                )
+            return value
+
+        if names is None:
+            names = [""] * n
+        elif isinstance(names, str):
+            # a single name for all variables would create duplicated names
+            raise TypeError(
+                "names should be a list with one name per variable"
+            )
+        return self.vars.add_vars(
+            expand(names, "names"),
+            expand(lb, "lb"),
+            expand(ub, "ub"),
+            expand(obj, "obj"),
+            expand(var_type, "var_type"),
+        )
+
     def add_constr(self: "Model", lin_expr: LinExpr, name: str = "") -> Constr:
         r"""Creates a new constraint (row).
 
@@ -249,12 +328,70 @@ class Model:
             m.add_constr( xsum(x[i] for i in range(n)) == y, "cons1" )
         """
 
-        if isinstance(lin_expr, bool):
+        # bool cannot be subclassed, so the exact type check is equivalent
+        # to isinstance and cheaper
+        if type(lin_expr) is bool:
             raise InvalidLinExpr(
                 "A boolean (true/false) cannot be " "used as a constraint."
             )
         return self.constrs.add(lin_expr, name)
 
+    def add_constrs(
+        self: "Model",
+        lin_exprs: List[LinExpr],
+        names: Optional[List[str]] = None,
+    ) -> List[Constr]:
+        r"""Creates several new constraints (rows) at once.
+
+        All constraints are sent to the solver engine in a single call when
+        the solver supports bulk insertion, which is faster than calling
+        :meth:`~mip.model.Model.add_constr` for each one of them.
+
+        Args:
+            lin_exprs(List[LinExpr]): linear expressions
+            names(List[str]): optional constraint names, used when saving
+              model to lp or mps files
+
+        Raises:
+            ValueError: if some item is not a linear expression with a sense
+              (:code:`<=`, :code:`>=` or :code:`==`); in this case no
+              constraint is added
+
+        Examples:
+
+        The following code adds constraints :math:`x_i + y_i \leq 1` for
+        :math:`i \in \{0, \ldots, n-1\}`::
+
+            m.add_constrs([x[i] + y[i] <= 1 for i in range(n)])
+        """
+        lin_exprs = list(lin_exprs)
+        if bool in map(type, lin_exprs):
+            raise InvalidLinExpr(
+                "A boolean (true/false) cannot be " "used as a constraint."
+            )
+        # all rows are checked before the solver is called, so that a bad
+        # row does not leave the solver with part of the batch
+        for i, lin_expr in enumerate(lin_exprs):
+            if not isinstance(lin_expr, LinExpr):
+                raise ValueError(
+                    "Constraint {} is not a linear expression: {}".format(
+                        i, type(lin_expr)
+                    )
+                )
+            if not lin_expr.sense:
+                raise ValueError(
+                    "Constraint {} has no sense (<=, >= or ==)".format(i)
+                )
+        if names is None:
+            names = [""] * len(lin_exprs)
+        elif len(names) != len(lin_exprs):
+            raise ValueError(
+                "{} names informed for {} constraints".format(
+                    len(names), len(lin_exprs)
+                )
+            )
+        return self.constrs.add_constrs(lin_exprs, names)
+
     def add_lazy_constr(self: "Model", expr: LinExpr):
         """Adds a lazy constraint
 
@@ -374,18 +511,20 @@ class Model:
         copy = Model(self.name, self.sense, solver_name)
 
         # adding variables
-        for v in self.vars:
-            copy.add_var(
-                name=v.name, lb=v.lb, ub=v.ub, obj=v.obj, var_type=v.var_type
-            )
+        orig_vars = self.vars
+        copy.add_vars(
+            len(orig_vars),
+            self.solver.vars_get_names(),
+            [v.lb for v in orig_vars],
+            [v.ub for v in orig_vars],
+            [v.obj for v in orig_vars],
+            [v.var_type for v in orig_vars],
+        )
 
-        # adding constraints
-        for c in self.constrs:
-            orig_expr = c.expr
-            expr = LinExpr(const=orig_expr.const, sense=orig_expr.sense)
-            for (var, value) in orig_expr.expr.items():
-                expr.add_term(self.vars[var.idx], value)
-            copy.add_constr(lin_expr=expr, name=c.name)
+        # adding constraints, variables are referenced only by their
+        # indexes, which are the same in both models
+        constrs = self.constrs
+        copy.add_constrs([c.expr for c in constrs], [c.name for c in constrs])
 
         # setting objective function"s constant
         copy.objective_const = self.objective_const
@@ -613,7 +752,9 @@ class Model:
                 save_mipstart(self.start, file_path)
             else:
                 mip_start = [
-                    (var, var.x) for var in self.vars if abs(var.x) >= 1e-8
+                    (var, x)
+                    for var, x in zip(self.vars, self.solver.vars_get_x())
+                    if abs(x) >= 1e-8
                 ]
                 save_mipstart(mip_start, file_path)
         elif file_path.lower().endswith(".lp") or file_path.lower().endswith(
@@ -836,10 +977,7 @@ class Model:
             as an array from 0 (the best solution) to
             :attr:`~mip.model.Model.num_solutions`-1.
         """
-        return [
-            float(self.solver.get_objective_value_i(i))
-            for i in range(self.num_solutions)
-        ]
+        return list(map(float, self.solver.get_objective_values_all()))
 
     @property
     def cuts_generator(self: "Model") -> "ConstrsGenerator":
@@ -1290,22 +1428,25 @@ class Model:
         solution(s) produced by the MIP solver respect all constraints and
         variable values are within acceptable bounds and are integral when
         requested"""
-        if self.status in [
+        # properties which query the solver are read only once
+        status = self.status
+        num_solutions = self.num_solutions
+        has_solution = status in [
             OptimizationStatus.FEASIBLE,
             OptimizationStatus.OPTIMAL,
-        ]:
-            assert self.num_solutions >= 1
-        if self.num_solutions or self.status in [
-            OptimizationStatus.FEASIBLE,
-            OptimizationStatus.OPTIMAL,
-        ]:
+        ]
+        if has_solution:
+            assert num_solutions >= 1
+        if num_solutions or has_solution:
             if self.sense == MINIMIZE:
                 assert self.objective_bound <= self.objective_value + 1e-10
             else:
                 assert self.objective_bound + 1e-10 >= self.objective_value
 
+            max_violation = self.infeas_tol + self.infeas_tol * 0.1
             for c in self.constrs:
-                if c.expr.violation >= self.infeas_tol + self.infeas_tol * 0.1:
+                violation = c.expr.violation
+                if violation >= max_violation:
                     raise InfeasibleSolution(
                         "Constraint {}:\n{}\n is violated."
                         "Computed violation is {}."
@@ -1313,25 +1454,26 @@ class Model:
                         "Solution status is {}.".format(
                             c.name,
                             str(c),
-                            c.expr.violation,
+                            violation,
                             self.infeas_tol,
-                            self.status,
+                            status,
                         )
                     )
-            for v in self.vars:
-                if v.x <= v.lb - 1e-10 or v.x >= v.ub + 1e-10:
+            max_int_dist = self.integer_tol + self.integer_tol * 0.1
+            for v, x in zip(self.vars, self.solver.vars_get_x()):
+                lb = v.lb
+                ub = v.ub
+                if x <= lb - 1e-10 or x >= ub + 1e-10:
                     raise InfeasibleSolution(
                         "Invalid solution value for "
                         "variable {}={} variable bounds"
-                        " are [{}, {}].".format(v.name, v.x, v.lb, v.ub)
+                        " are [{}, {}].".format(v.name, x, lb, ub)
                     )
                 if v.var_type in [BINARY, INTEGER]:
-                    if (
-                        round(v.x) - v.x
-                    ) >= self.integer_tol + self.integer_tol * 0.1:
+                    if (round(x) - x) >= max_int_dist:
                         raise InfeasibleSolution(
                             "Variable {}={} should be integral.".format(
-                                v.name, v.x
+                                v.name, x
                             )
                         )
 
@@ -1373,13 +1515,71 @@ def xsum(terms) -> LinExpr:
 
     Args:
         terms: set (ideally a list) of terms to be summed
+
+    For weighted sums of variables whose coefficients are already stored in
+    a list, :func:`xsum_terms` avoids creating one expression per term.
     """
     result = LinExpr()
+    # variables and single-term expressions (such as w[i] * x[i]) are
+    # buffered and merged at once at the end, avoiding one add_term call
+    # per term; constants are summed apart
+    variables = []
+    coeffs = []
+    add_variable = variables.append
+    add_coeff = coeffs.append
+    const = 0.0
+    # exact type checks are faster than isinstance, subclasses and other
+    # numeric types are handled by add_term
     for term in terms:
-        result.add_term(term)
+        term_type = type(term)
+        if term_type is Var:
+            add_variable(term)
+            add_coeff(1.0)
+        elif term_type is LinExpr:
+            expr = term.expr
+            if len(expr) == 1 and not term.const:
+                ((var, coeff),) = expr.items()
+                add_variable(var)
+                add_coeff(coeff)
+            else:
+                result.add_expr(term)
+        elif term_type is float or term_type is int:
+            const += term
+        else:
+            result.add_term(term)
+    if variables:
+        result.add_expr(LinExpr(variables, coeffs))
+    if const:
+        result.add_const(const)
     return result
 
 
+def xsum_terms(coeffs, variables) -> LinExpr:
+    """
+    Creates the weighted sum of variables with the given coefficients.
+    Produces the same result as
+    :code:`xsum(coeffs[i] * variables[i] for i in range(n))`, but builds
+    the expression directly from both sequences, without creating one
+    intermediate expression per term:
+
+    .. code:: python
+
+      m += xsum_terms(w, x) <= c
+
+    This is also the fastest way of creating families of constraints with
+    the same variables, such as the rows of a coefficient matrix:
+
+    .. code:: python
+
+      m.add_constrs([xsum_terms(A[i], x) <= b[i] for i in range(len(b))])
+
+    Args:
+        coeffs: coefficients of the variables
+        variables: variables, in the same order as their coefficients
+    """
+    return LinExpr(list(variables), list(coeffs))
+
+
 # function aliases
 quicksum = xsum
 
@@ -1393,40 +1593,45 @@ def save_mipstart(sol: List[Tuple[Var, float]], file_name: str, obj=0.0):
 
 
 def load_mipstart(file_name: str) -> List[Tuple[str, float]]:
-    f = open(file_name, "w")
     result = []
-    line = f.next()
-    for line in f:
-        line = line.rstrip().lstrip().lower()
-        line = " ".join(line.split())
-        lc = line.split(" ")
-        result.append((lc[1], float(lc[2])))
+    with open(file_name, "r") as f:
+        # first line contains the solution status and objective value,
+        # variable names are case sensitive
+        next(f, None)
+        for line in f:
+            lc = line.split()
+            if len(lc) >= 3:
+                result.append((lc[1], float(lc[2])))
     return result
 
 
-def read_custom_settings():
-    global customCbcLib
+def read_custom_settings() -> str:
+    """returns the CBC library informed in the PMIP_CBC_LIBRARY environment
+    variable or in the cbc-library entry of ~/.config/python-mip, or an
+    empty string if no custom library was informed"""
     from pathlib import Path
 
-    home = str(Path.home())
-    import os
-
-    config_path = os.path.join(home, ".config")
-    if os.path.isdir(config_path):
-        config_file = os.path.join(config_path, "python-mip")
-        if os.path.isfile(config_file):
-            f = open(config_file, "r")
-            for line in f:
-                if "=" in line:
-                    cols = line.split("=")
-                    if cols[0].strip().lower() == "cbc-library":
-                        customCbcLib = (
-                            cols[1].lstrip().rstrip().replace('"', "")
-                        )
+    # the environment variable has precedence over the configuration file,
+    # in this case the file is not even opened
+    cbc_lib = environ.get("PMIP_CBC_LIBRARY", "")
+    if cbc_lib:
+        return cbc_lib
+
+    # a single read attempt: a missing ~/.config or ~/.config/python-mip
+    # is the common case and costs one failed system call
+    try:
+        text = Path.home().joinpath(".config", "python-mip").read_text()
+    except (OSError, RuntimeError, UnicodeDecodeError):
+        return ""
+
+    for line in text.splitlines():
+        if "=" in line:
+            cols = line.split("=")
+            if cols[0].strip().lower() == "cbc-library":
+                cbc_lib = cols[1].strip().replace('"', "")
+    return cbc_lib
 
 
 logger.info("Using Python-MIP package version {}".format(VERSION))
-customCbcLib = ""
-read_custom_settings()
 
 # vim: ts=4 sw=4 et
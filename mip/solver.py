@@ -15,7 +15,8 @@ if TYPE_CHECKING:
 
 class Solver:
     """The solver is an abstract class with the solver independent
-    API to communicate with the solver engine"""
+    API to communicate with the solver engine. Methods which are not
+    implemented by a solver engine raise NotImplementedError."""
 
     def __init__(
         self: "Solver", model: "Model", name: str = "", sense: str = ""
@@ -38,33 +39,56 @@ class Solver:
         var_type: str = CONTINUOUS,
         column: "Column" = None,
     ):
-        pass
+        raise NotImplementedError()
+
+    def add_vars(
+        self: "Solver",
+        obj: List[numbers.Real],
+        lb: List[numbers.Real],
+        ub: List[numbers.Real],
+        var_type: List[str],
+        names: List[str],
+    ):
+        """adds several variables at once, solvers with a bulk API should
+        override this method to insert all of them in a single call"""
+        add_var = self.add_var
+        for i in range(len(names)):
+            add_var(obj[i], lb[i], ub[i], var_type[i], None, names[i])
 
     def add_constr(self: "Solver", lin_expr: "LinExpr", name: str = ""):
-        pass
+        raise NotImplementedError()
+
+    def add_constrs(
+        self: "Solver", lin_exprs: List["LinExpr"], names: List[str]
+    ):
+        """adds several constraints at once, solvers with a bulk API should
+        override this method to insert all of them in a single call"""
+        add_constr = self.add_constr
+        for lin_expr, name in zip(lin_exprs, names):
+            add_constr(lin_expr, name)
 
     def add_lazy_constr(self: "Solver", lin_expr: "LinExpr"):
-        pass
+        raise NotImplementedError()
 
     def add_sos(
         self: "Solver", sos: List[Tuple["Var", numbers.Real]], sos_type: int
     ):
-        pass
+        raise NotImplementedError()
 
     def add_cut(self: "Solver", lin_expr: "LinExpr"):
-        pass
+        raise NotImplementedError()
 
     def get_objective_bound(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def get_objective(self: "Solver") -> "LinExpr":
-        pass
+        raise NotImplementedError()
 
     def get_objective_const(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def relax(self: "Solver"):
-        pass
+        raise NotImplementedError()
 
     def generate_cuts(
         self,
@@ -72,13 +96,13 @@ class Solver:
         max_cuts: int = maxsize,
         min_viol: numbers.Real = 1e-4,
     ) -> CutPool:
-        pass
+        raise NotImplementedError()
 
     def optimize(self: "Solver", relax: bool = False,) -> OptimizationStatus:
-        pass
+        raise NotImplementedError()
 
     def get_objective_value(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def get_log(
         self: "Solver",
@@ -86,25 +110,33 @@ class Solver:
         return []
 
     def get_objective_value_i(self: "Solver", i: int) -> numbers.Real:
-        pass
+        raise NotImplementedError()
+
+    def get_objective_values_all(self: "Solver") -> List[numbers.Real]:
+        """costs of all solutions in the solution pool, solvers which can
+        query them faster should override this method"""
+        get_objective_value_i = self.get_objective_value_i
+        return [
+            get_objective_value_i(i) for i in range(self.get_num_solutions())
+        ]
 
     def get_num_solutions(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def get_objective_sense(self: "Solver") -> str:
-        pass
+        raise NotImplementedError()
 
     def set_objective_sense(self: "Solver", sense: str):
-        pass
+        raise NotImplementedError()
 
     def set_start(self: "Solver", start: List[Tuple["Var", numbers.Real]]):
-        pass
+        raise NotImplementedError()
 
     def set_objective(self: "Solver", lin_expr: "LinExpr", sense: str = ""):
-        pass
+        raise NotImplementedError()
 
     def set_objective_const(self: "Solver", const: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def set_processing_limits(
         self: "Solver",
@@ -112,170 +144,184 @@ class Solver:
         max_nodes: int = maxsize,
         max_sol: int = maxsize,
     ):
-        pass
+        raise NotImplementedError()
 
     def get_max_seconds(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def set_max_seconds(self: "Solver", max_seconds: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def get_max_solutions(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def set_max_solutions(self: "Solver", max_solutions: int):
-        pass
+        raise NotImplementedError()
 
     def get_pump_passes(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def set_pump_passes(self: "Solver", passes: int):
-        pass
+        raise NotImplementedError()
 
     def get_max_nodes(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def set_max_nodes(self: "Solver", max_nodes: int):
-        pass
+        raise NotImplementedError()
 
     def set_num_threads(self: "Solver", threads: int):
-        pass
+        raise NotImplementedError()
 
     def write(self: "Solver", file_path: str):
-        pass
+        raise NotImplementedError()
 
     def read(self: "Solver", file_path: str):
-        pass
+        raise NotImplementedError()
 
     def num_cols(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def num_rows(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def num_nz(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def num_int(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def get_emphasis(self: "Solver") -> SearchEmphasis:
-        pass
+        raise NotImplementedError()
 
     def set_emphasis(self: "Solver", emph: SearchEmphasis):
-        pass
+        raise NotImplementedError()
 
     def get_cutoff(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def set_cutoff(self: "Solver", cutoff: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def get_mip_gap_abs(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def set_mip_gap_abs(self: "Solver", mip_gap_abs: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def get_mip_gap(self: "Solver") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def set_mip_gap(self: "Solver", mip_gap: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def get_verbose(self: "Solver") -> int:
-        pass
+        raise NotImplementedError()
 
     def set_verbose(self: "Solver", verbose: int):
-        pass
+        raise NotImplementedError()
 
     # Constraint-related getters/setters
 
     def constr_get_expr(self: "Solver", constr: "Constr") -> "LinExpr":
-        pass
+        raise NotImplementedError()
 
     def constr_set_expr(
         self: "Solver", constr: "Constr", value: "LinExpr"
     ) -> "LinExpr":
-        pass
+        raise NotImplementedError()
 
     def constr_get_rhs(self: "Solver", idx: int) -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def constr_set_rhs(self: "Solver", idx: int, rhs: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def constr_get_name(self: "Solver", idx: int) -> str:
-        pass
+        raise NotImplementedError()
 
     def constr_get_pi(self: "Solver", constr: "Constr") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def constr_get_slack(self: "Solver", constr: "Constr") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def remove_constrs(self: "Solver", constrsList: List[int]):
-        pass
+        raise NotImplementedError()
 
     def constr_get_index(self: "Solver", name: str) -> int:
-        pass
+        raise NotImplementedError()
 
     # Variable-related getters/setters
 
     def var_get_lb(self: "Solver", var: "Var") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def var_set_lb(self: "Solver", var: "Var", value: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def var_get_ub(self: "Solver", var: "Var") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def var_set_ub(self: "Solver", var: "Var", value: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def var_get_obj(self: "Solver", var: "Var") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def var_set_obj(self: "Solver", var: "Var", value: numbers.Real):
-        pass
+        raise NotImplementedError()
 
     def var_get_var_type(self: "Solver", var: "Var") -> str:
-        pass
+        raise NotImplementedError()
 
     def var_set_var_type(self: "Solver", var: "Var", value: str):
-        pass
+        raise NotImplementedError()
 
     def var_get_column(self: "Solver", var: "Var") -> "Column":
-        pass
+        raise NotImplementedError()
 
     def var_set_column(self: "Solver", var: "Var", value: "Column"):
-        pass
+        raise NotImplementedError()
 
     def var_get_rc(self: "Solver", var: "Var") -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def var_get_x(self: "Solver", var: "Var") -> numbers.Real:
         """Assumes that the solution is available (should be checked
            before calling it"""
+        raise NotImplementedError()
+
+    def vars_get_x(self: "Solver") -> List[Optional[numbers.Real]]:
+        """values of all variables in the solution (None if not available),
+        solvers which store the solution in a single buffer should override
+        this method to retrieve it at once"""
+        var_get_x = self.var_get_x
+        return [var_get_x(var) for var in self.model.vars]
 
     def var_get_xi(self: "Solver", var: "Var", i: int) -> numbers.Real:
-        pass
+        raise NotImplementedError()
 
     def var_get_name(self: "Solver", idx: int) -> str:
-        pass
+        raise NotImplementedError()
+
+    def vars_get_names(self: "Solver") -> List[str]:
+        """names of all variables, ordered by index; solvers which can
+        query all names in one call should override this method"""
+        var_get_name = self.var_get_name
+        return [var_get_name(idx) for idx in range(self.num_cols())]
 
     def remove_vars(self: "Solver", varsList: List[int]):
-        pass
+        raise NotImplementedError()
 
     def var_get_index(self: "Solver", name: str) -> int:
-        pass
+        raise NotImplementedError()
 
     def get_problem_name(self: "Solver") -> str:
-        pass
+        raise NotImplementedError()
 
     def set_problem_name(self: "Solver", name: str):
-        pass
+        raise NotImplementedError()
 
     def get_status(self: "Solver") -> OptimizationStatus:
-        pass
+        raise NotImplementedError()
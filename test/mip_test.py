@@ -4,6 +4,7 @@ import pytest
 import networkx as nx
 from mip import Model, xsum, OptimizationStatus, MAXIMIZE, BINARY, INTEGER
 from mip import ConstrsGenerator, CutPool, maximize, CBC, GUROBI, Column
+from mip import LinExpr, Var, VVarList, InvalidLinExpr, xsum_terms
 from os import environ
 
 TOL = 1e-4
@@ -653,3 +654,268 @@ def test_add_column(solver: str):
     assert len(example_constr1.expr.expr) == 2
     assert second_var in example_constr1.expr.expr
     assert x in example_constr1.expr.expr
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_hash_order(solver: str):
+    m = Model(solver_name=solver)
+    x = [m.add_var() for i in range(3)]
+    a = 2 * x[0] + 3 * x[1] - x[2] <= 4
+    b = -x[2] + 3 * x[1] + 2 * x[0] <= 4
+    assert hash(a) == hash(b)
+    assert a.equals(b)
+
+    # repeated cuts are discarded regardless of the order of their terms
+    cp = CutPool()
+    assert cp.add(a)
+    assert not cp.add(b)
+    assert len(cp.cuts) == 1
+
+    # cached hash codes are updated when expressions change
+    c = a.copy()
+    assert hash(c) == hash(a)
+    c.add_var(x[2], 1)
+    d = LinExpr([x[0], x[1]], [2, 3], -4, "<")
+    assert hash(c) == hash(d)
+    c.sense = ">"
+    assert hash(c) != hash(d)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_str(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_var(name="x")
+    y = m.add_var(name="y")
+    assert str(LinExpr([x, y], [1, 2], -3, "<")) == "+ x + 2y <= 3"
+    assert str(LinExpr([x, y], [1, -1], sense="=")) == "+ x - y = 0"
+    assert str(LinExpr([x, y], [1, -2.5], 1)) == "+ x - 2.5y + 1"
+    assert str(maximize(LinExpr([x, y], [1, 1]))) == "Maximize + x + y "
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_add_vars_constrs(solver: str):
+    n = 10
+    p = [10, 13, 18, 31, 7, 15, 12, 9, 21, 4]
+    w = [11, 15, 20, 35, 10, 33, 8, 14, 25, 5]
+    m = Model(sense=MAXIMIZE, solver_name=solver)
+    x = m.add_vars(n, var_type=BINARY, obj=p)
+    y = m.add_vars(n, ["y({})".format(i) for i in range(n)], ub=0.5)
+    assert len(x) == len(y) == n and m.num_cols == 2 * n
+    assert [v.idx for v in y] == list(range(n, 2 * n))
+    assert m.var_by_name("y(3)").idx == y[3].idx
+    assert x[2].ub == 1.0
+
+    constrs = m.add_constrs(
+        [xsum(w[i] * x[i] for i in range(n)) <= 47]
+        + [y[i] <= x[i] for i in range(n)],
+        ["capacity"] + ["link({})".format(i) for i in range(n)],
+    )
+    assert len(constrs) == m.num_rows == n + 1
+    assert m.constr_by_name("capacity").idx == constrs[0].idx
+
+    m.optimize()
+    assert m.status == OptimizationStatus.OPTIMAL
+    assert abs(m.objective_value - 44) <= TOL
+    assert len(m.objective_values) == m.num_solutions >= 1
+    assert m.solver.vars_get_x() == [v.x for v in m.vars]
+    assert abs(m.objective_values[0] - 44) <= TOL
+
+    # copy is built with bulk insertion of variables and constraints
+    mc = m.copy()
+    assert mc.num_cols == m.num_cols and mc.num_rows == m.num_rows
+    assert mc.constrs[0].name == "capacity"
+    assert mc.solver.vars_get_names() == [v.name for v in m.vars]
+    assert mc.vars[n + 3].name == "y(3)"
+    mc.optimize()
+    assert mc.status == OptimizationStatus.OPTIMAL
+    assert abs(mc.objective_value - 44) <= TOL
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_add_constrs_invalid(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_vars(3)
+    with pytest.raises(ValueError):
+        m.add_constrs([x[0] + x[1] <= 1, x[1] + x[2]])
+    with pytest.raises(ValueError):
+        m.add_constrs([x[0] <= 1, 2])
+    assert m.num_rows == len(m.constrs) == 0
+    c = m.add_constr(x[0] + x[2] >= 1)
+    assert c.idx == 0 and m.num_rows == len(m.constrs) == 1
+    with pytest.raises(TypeError):
+        m.add_vars(2, "y")
+    assert m.num_cols == 3
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_hash(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_vars(2)
+    assert hash(x[0] + 2 * x[1] <= 3) == hash(2 * x[1] + x[0] <= 3)
+    assert hash(x[0] + 2 * x[1] <= 3) != hash(2 * x[0] + x[1] <= 3)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_scale_in_place(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_vars(2)
+    e = x[0] + 3 * x[1] + 1
+    terms = e.expr
+    e *= 2
+    assert terms[x[0]] == 2 and terms[x[1]] == 6 and e.const == 2
+    e /= 4
+    assert terms[x[0]] == 0.5 and e.expr is terms and e.const == 0.5
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_vvarlist_interned(solver: str):
+    m = Model(solver_name=solver)
+    m.add_var("x")
+    m.add_var("y")
+    vvars = VVarList(m)
+    x = vvars[0]
+    assert vvars[0] is x
+    # expressions built from repeated accesses merge terms
+    expr = vvars[0] + vvars[1] + vvars[0]
+    assert len(expr.expr) == 2
+    assert abs(expr.expr[x] - 2) <= TOL
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_entities_slots(solver: str):
+    # variables, constraints and expressions are created in large numbers,
+    # none of them should carry a per-instance __dict__
+    m = Model(solver_name=solver)
+    x = m.add_var()
+    c = m.add_constr(x <= 1)
+    for obj in [x, c, x + 1, Column()]:
+        assert not hasattr(obj, "__dict__")
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+@pytest.mark.parametrize("name", ["x{}", "X{}"])
+def test_read_mipstart(solver: str, name: str, tmp_path):
+    m = Model(solver_name=solver)
+    x = [m.add_var(name.format(i), var_type=BINARY) for i in range(3)]
+    m.start = [(x[0], 1.0), (x[2], 1.0)]
+    path = str(tmp_path / "start.sol")
+    m.write(path)
+
+    m2 = Model(solver_name=solver)
+    for i in range(3):
+        m2.add_var(name.format(i), var_type=BINARY)
+    m2.read(path)
+    assert [(v.name, val) for v, val in m2.start] == [
+        (name.format(0), 1.0),
+        (name.format(2), 1.0),
+    ]
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_add_sub_sizes(solver: str):
+    m = Model(solver_name=solver)
+    x = [m.add_var() for _ in range(4)]
+    small = LinExpr([x[0]], [1], 1)
+    big = LinExpr(x, [1, 2, 3, 4], 2)
+    assert (small + big).equals(LinExpr(x, [2, 2, 3, 4], 3))
+    assert (small - big).equals(LinExpr(x[1:], [-2, -3, -4], -1))
+    assert (big - small).equals(LinExpr(x[1:], [2, 3, 4], 1))
+    assert (5 - big).equals(LinExpr(x, [-1, -2, -3, -4], 3))
+    # operands are not modified
+    assert big.equals(LinExpr(x, [1, 2, 3, 4], 2))
+    assert small.equals(LinExpr([x[0]], [1], 1))
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_xsum_mixed_terms(solver: str):
+    m = Model(solver_name=solver)
+    x = [m.add_var() for _ in range(3)]
+    expr = xsum([2 * x[0], x[1], x[0] + x[2] + 1, 3, -2 * x[1], x[2] - 4])
+    assert expr.equals(LinExpr(x, [3, -1, 2], 0))
+    assert xsum([]).equals(LinExpr())
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_xsum_terms(solver: str):
+    m = Model(solver_name=solver)
+    x = [m.add_var() for _ in range(50)]
+    w = [i % 7 - 3 for i in range(50)]
+    expr = xsum_terms(w, x)
+    assert expr.equals(xsum(w[i] * x[i] for i in range(50)))
+    assert x[3] not in expr.expr
+    assert xsum_terms((2, 1), (x[0], x[0])).equals(LinExpr([x[0]], [3]))
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_bool_constraint(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_var()
+    with pytest.raises(InvalidLinExpr):
+        m.add_constr(x is None)
+    with pytest.raises(InvalidLinExpr):
+        m.add_constrs([x <= 1, False])
+    assert m.num_rows == 0
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_compile_eval(solver: str):
+    m = Model(solver_name=solver)
+    x = [m.add_var() for _ in range(200)]
+    vals = [0.5 * i for i in range(200)]
+    expr = xsum((i % 7 - 3) * x[i] for i in range(200)) + 2.5
+    f = expr.compile_eval()
+    expected = sum(c * vals[v.idx] for v, c in expr.expr.items()) + 2.5
+    assert abs(f(vals) - expected) <= TOL
+    assert abs((3 * x[4] - 1).compile_eval()(vals) - 5) <= TOL
+    assert LinExpr(const=-2).compile_eval()(vals) == -2
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_linexpr_large_constructor(solver: str):
+    m = Model(solver_name=solver)
+    x = [m.add_var() for _ in range(40)]
+    # distinct variables
+    expr = LinExpr(x, [i + 1 for i in range(40)])
+    assert len(expr.expr) == 40 and expr.expr[x[39]] == 40
+    # repeated variables and zero coefficients are merged
+    expr = LinExpr(x + x, [1] * 40 + [-1] * 39 + [1])
+    assert len(expr.expr) == 1 and expr.expr[x[39]] == 2
+    expr = LinExpr(x, [0] + [1] * 39)
+    assert len(expr.expr) == 39 and x[0] not in expr.expr
+    assert xsum(x + [1, 2.5]).equals(LinExpr(x, [1] * 40, 3.5))
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_var_same_column_objects(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_var()
+    y = m.add_var()
+    # distinct objects for the same column are the same dict key
+    x2 = Var(m, x.idx)
+    assert x2 is not x
+    expr = x + y + x2
+    assert len(expr.expr) == 2 and expr.expr[x] == 2
+    assert (x == x2).equals(LinExpr(sense="="))
+    assert (x == y).equals(LinExpr([x, y], [1, -1], sense="="))
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_objective_const(solver: str):
+    m = Model(solver_name=solver)
+    x = m.add_var(lb=1)
+    m.objective = x + 2
+    assert abs(m.objective_const - 2) <= TOL
+    m.objective_const = 5
+    assert abs(m.objective_const - 5) <= TOL
+    m.optimize()
+    assert abs(m.objective_value - 6) <= TOL
+
+
+def test_cbc_not_implemented():
+    m = Model(solver_name=CBC)
+    x = m.add_var()
+    c = m.add_constr(x <= 1)
+    with pytest.raises(NotImplementedError):
+        c.expr = x + 0 <= 2
+    with pytest.raises(NotImplementedError):
+        x.column = Column()